@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+import torch
+
+from utmosv2._core.model._common import _length_order, _restore_order
+from utmosv2.dataset._schema import DatasetSchema
+
+
+def test_length_order_tensors() -> None:
+    lengths = [300, 100, 200, 100]
+    data = [
+        DatasetSchema(audio_tensor=torch.zeros(n) if i % 2 else np.zeros(n))
+        for i, n in enumerate(lengths)
+    ]
+    order = _length_order(data)
+    np.testing.assert_array_equal(order, [1, 3, 2, 0])
+
+
+def test_length_order_files(tmp_path: Path) -> None:
+    lengths = [16000, 4000, 8000]
+    data = []
+    for i, n in enumerate(lengths):
+        path = tmp_path / f"{i}.wav"
+        sf.write(path, np.zeros(n, dtype=np.float32), 16000)
+        data.append(DatasetSchema(file_path=path))
+    order = _length_order(data)
+    np.testing.assert_array_equal(order, [1, 2, 0])
+
+
+def test_restore_order() -> None:
+    lengths = np.array([5, 1, 4, 2, 3])
+    data = [DatasetSchema(audio_tensor=np.zeros(n)) for n in lengths]
+    order = _length_order(data)
+    # Stand-in for the model: predict each sample's length from the sorted batch order.
+    sorted_pred = lengths[order].astype(np.float32)
+    np.testing.assert_array_equal(_restore_order(sorted_pred, order), lengths)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import librosa
+import numpy as np
+import pytest
+import soundfile as sf
+
+from utmosv2.dataset._utils import _read_audio
+
+
+def test_read_audio_window(tmp_path: Path) -> None:
+    path = tmp_path / "ramp.wav"
+    audio = np.linspace(-1, 1, 16000, dtype=np.float32)
+    sf.write(path, audio, 16000, subtype="FLOAT")
+    for _ in range(10):
+        y = _read_audio(path, 16000, 1000)
+        assert y.shape[0] > 1000
+        start = int(np.argmin(np.abs(audio - y[0])))
+        np.testing.assert_array_equal(y, audio[start : start + y.shape[0]])
+
+
+def test_read_audio_short_file(tmp_path: Path) -> None:
+    path = tmp_path / "short.wav"
+    audio = np.linspace(-1, 1, 500, dtype=np.float32)
+    sf.write(path, audio, 16000, subtype="FLOAT")
+    np.testing.assert_array_equal(_read_audio(path, 16000, 1000), audio)
+
+
+@pytest.mark.parametrize("frames", [48000, 48001, 48002])
+@pytest.mark.parametrize("last", [False, True])
+def test_read_audio_window_resampled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, frames: int, last: bool
+) -> None:
+    path = tmp_path / "sine.wav"
+    audio = np.sin(2 * np.pi * 440 * np.arange(frames) / 48000).astype(np.float32)
+    sf.write(path, audio, 48000, subtype="FLOAT")
+    monkeypatch.setattr(
+        np.random, "randint", lambda low, high: high - 1 if last else low
+    )
+    length = 4000
+    y = _read_audio(path, 16000, length)
+    assert y.shape[0] > length
+    window_start = frames - (3 * length + 1) if last else 0
+    full = librosa.resample(audio, orig_sr=48000, target_sr=16000)
+    start = window_start * 16000 // 48000
+    np.testing.assert_allclose(y, full[start : start + y.shape[0]], atol=1e-4)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+
+from utmosv2.preprocess import remove_silent_section, remove_silent_section_tensor
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_remove_silent_section_tensor(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    audio = rng.uniform(-1, 1, 48000).astype(np.float32)
+    for start in rng.integers(0, audio.shape[0], 5):
+        audio[start : start + rng.integers(1000, 10000)] = 0.0
+    expected = remove_silent_section(audio)
+    actual = remove_silent_section_tensor(torch.from_numpy(audio)).numpy()
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_remove_silent_section_tensor_numpy_input() -> None:
+    rng = np.random.default_rng(0)
+    audio = rng.uniform(-1, 1, 48000).astype(np.float32)
+    audio[10000:20000] = 0.0
+    actual = remove_silent_section_tensor(audio)
+    assert isinstance(actual, torch.Tensor)
+    np.testing.assert_array_equal(actual.numpy(), remove_silent_section(audio))
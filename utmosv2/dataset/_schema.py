@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-
+import numpy as np
 import torch
 
+# NOTE: `slots` is only available from Python 3.10, so Python 3.9 gets a frozen dataclass
+# with a per-instance `__dict__`. Once Python 3.9 is dropped, this can be inlined.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class DatasetSchema:
     file_path: Path | None = None
     dataset: str = "sarulab"
     mos: int | None = None
-    audio_tensor: torch.Tensor | None = None
+    audio_tensor: np.ndarray | torch.Tensor | None = None
@@ -1,15 +1,28 @@
+from __future__ import annotations
+
 import json
+import math
 from pathlib import Path
 
 import librosa
 import numpy as np
+import soundfile as sf
 
 from utmosv2._settings._config import Config
 
 import torch
 
 
-def load_audio(cfg: Config, file: Path | None = None, tensor: np.ndarray | torch.Tensor | None = None) -> np.ndarray:
+def load_audio(
+    cfg: Config,
+    file: Path | None = None,
+    tensor: np.ndarray | torch.Tensor | None = None,
+    length: int | None = None,
+) -> np.ndarray:
+    """
+    Load audio at `cfg.sr`. If `length` is given, only a randomly placed window of at least
+    `length` samples (after resampling) is decoded from `.wav`/`.flac` files, instead of the whole file.
+    """
     if tensor is not None:
         if isinstance(tensor, torch.Tensor):
             return tensor.cpu().numpy()
@@ -17,14 +30,48 @@ def load_audio(cfg: Config, file: Path | None = None, tensor: np.ndarray | torch
             return tensor
     elif file is not None:
         if file.suffix in [".wav", ".flac"]:
-            y, sr = librosa.load(file, sr=None)
-            y = librosa.resample(y, orig_sr=sr, target_sr=cfg.sr)
+            y = _read_audio(file, cfg.sr, length)
         else:
             y = np.load(file)
         return y
     else:
         raise ValueError("Either file or tensor must be provided")
 
+
+# Source frames decoded on each side of a window and trimmed again after resampling,
+# so that the resampling filter's edge effects stay outside the window.
+_RESAMPLE_MARGIN = 512
+
+
+def _read_audio(file: Path, target_sr: int, length: int | None) -> np.ndarray:
+    start, offset = 0, 0
+    stop: int | None = None
+    size: int | None = None
+    if length is not None:
+        info = sf.info(file)
+        sr = info.samplerate
+        # One extra frame so that the resampled window is longer than `length`;
+        # a window of exactly `length` samples would be tiled by `extend_audio`.
+        window = math.ceil(length * sr / target_sr) + 1
+        if info.frames >= window:
+            window_start = np.random.randint(0, info.frames - window + 1)
+            # Aligning `start` keeps the resampled samples on the same grid as a resample
+            # of the whole file.
+            step = sr // math.gcd(sr, target_sr)
+            start = max(window_start - _RESAMPLE_MARGIN, 0) // step * step
+            stop = min(window_start + window + _RESAMPLE_MARGIN, info.frames)
+            # Rounding down keeps the window inside the resampled chunk even when it ends
+            # at the last frame of the file.
+            offset = (window_start - start) * target_sr // sr
+            size = math.ceil(window * target_sr / sr)
+    y, sr = sf.read(file, start=start, stop=stop, dtype="float32", always_2d=True)
+    # Downmix the same way `librosa.load` does.
+    y = librosa.resample(librosa.to_mono(y.T), orig_sr=sr, target_sr=target_sr)
+    if size is not None:
+        y = y[offset : offset + size]
+    return y
+
+
 def extend_audio(cfg: Config, y: np.ndarray, length: int, type: str) -> np.ndarray:
     if y.shape[0] > length:
         return y
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
@@ -144,20 +145,33 @@ def _make_spctrogram(cfg: Config, spec_cfg: Config, y: np.ndarray) -> np.ndarray
 
 
 def _make_melspec(cfg: Config, spec_cfg: Config, y: np.ndarray) -> np.ndarray:
-    spec = librosa.feature.melspectrogram(
-        y=y,
-        sr=cfg.sr,
-        n_fft=spec_cfg.n_fft,
-        hop_length=spec_cfg.hop_length,
-        n_mels=spec_cfg.n_mels,
-        win_length=spec_cfg.win_length,
+    # Same as `librosa.feature.melspectrogram`, but without rebuilding the mel filterbank
+    # for every spectrogram.
+    power = (
+        np.abs(
+            librosa.stft(
+                y=y,
+                n_fft=spec_cfg.n_fft,
+                hop_length=spec_cfg.hop_length,
+                win_length=spec_cfg.win_length,
+            )
+        )
+        ** 2
     )
+    spec = _mel_filters(cfg.sr, spec_cfg.n_fft, spec_cfg.n_mels) @ power
     spec = librosa.power_to_db(spec, ref=np.max)
     if spec_cfg.norm is not None:
         spec = (spec + spec_cfg.norm) / spec_cfg.norm
     return spec
 
 
+@functools.lru_cache(maxsize=None)
+def _mel_filters(sr: int, n_fft: int, n_mels: int) -> np.ndarray:
+    mel_basis = librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels)
+    mel_basis.setflags(write=False)
+    return mel_basis
+
+
 def _make_stft(cfg: Config, spec_cfg: Config, y: np.ndarray) -> np.ndarray:
     spec = librosa.stft(y=y, n_fft=spec_cfg.n_fft, hop_length=spec_cfg.hop_length)
     spec = np.abs(spec)
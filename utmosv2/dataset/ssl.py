@@ -48,18 +48,22 @@ class SSLDataset(_BaseDataset):
         """
         row = self.data[idx] if isinstance(self.data, list) else self.data.iloc[idx]
         file = row.file_path
-        
+        remove_silent = (
+            hasattr(self.cfg.dataset, "remove_silent_section")
+            and self.cfg.dataset.remove_silent_section
+        )
+        length = int(self.cfg.dataset.ssl.duration * self.cfg.sr)
+
         if row.audio_tensor is not None:
             y = load_audio(self.cfg, tensor=row.audio_tensor)
         else:
-            y = load_audio(self.cfg, file=file)
+            # Silence removal needs the whole file; otherwise only the cropped window is decoded.
+            y = load_audio(
+                self.cfg, file=file, length=None if remove_silent else length
+            )
 
-        if (
-            hasattr(self.cfg.dataset, "remove_silent_section")
-            and self.cfg.dataset.remove_silent_section
-        ):
+        if remove_silent:
             y = remove_silent_section(y)
-        length = int(self.cfg.dataset.ssl.duration * self.cfg.sr)
         y = extend_audio(self.cfg, y, length, type="tile")
         y = select_random_start(y, length)
 
@@ -3,6 +3,13 @@ from utmosv2.preprocess._preprocess import (
     preprocess,
     preprocess_test,
     remove_silent_section,
+    remove_silent_section_tensor,
 )
 
-__all__ = ["add_sys_mean", "preprocess", "preprocess_test", "remove_silent_section"]
+__all__ = [
+    "add_sys_mean",
+    "preprocess",
+    "preprocess_test",
+    "remove_silent_section",
+    "remove_silent_section_tensor",
+]
@@ -1,9 +1,12 @@
+from __future__ import annotations
+
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import librosa
 import numpy as np
+import torch
 from tqdm import tqdm
 
 from utmosv2._import import _LazyImport
@@ -28,6 +31,27 @@ def remove_silent_section(audio: np.ndarray, min_length: int = 4800) -> np.ndarr
     return audio[~mask2]
 
 
+def remove_silent_section_tensor(
+    audio: np.ndarray | torch.Tensor, min_length: int = 4800
+) -> torch.Tensor:
+    """
+    Same as `remove_silent_section`, but vectorized in PyTorch so it runs on the tensor's device.
+    Numpy arrays are converted with `torch.as_tensor` and processed on the CPU.
+    """
+    audio = torch.as_tensor(audio)
+    mask = audio < 0.1
+    pad = mask.new_zeros(1)
+    mask = torch.cat([pad, mask]) ^ torch.cat([mask, pad])
+    indices = torch.nonzero(mask).squeeze(1)
+    starts, ends = indices[::2], indices[1::2]
+    long = ends - starts > min_length
+    mask2 = torch.zeros(audio.shape[0] + 1, dtype=torch.int64, device=audio.device)
+    mask2[starts[long]] = 1
+    mask2[ends[long]] = -1
+    mask2 = torch.cumsum(mask2, dim=0).bool()[:-1]
+    return audio[~mask2]
+
+
 def _clip_audio(cfg: Config, data: "pd.DataFrame", data_name: str = "bvcc") -> None:
     (cfg.preprocess.save_path / data_name).mkdir(parents=True, exist_ok=True)
     for file in tqdm(data["file_path"].values, desc="Clipping audio files"):